@@ -0,0 +1,7 @@
+"""
+Allow running the CLI as a module: python -m cli
+"""
+
+from cli.main import cli_entry_point
+
+cli_entry_point()
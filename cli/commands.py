@@ -14,9 +14,6 @@ import asyncio
 import logging
 from typing import Dict, Optional, Any
 
-from services.help_service import HelpService
-from services.health_service import HealthService
-from services.analysis_service import AnalysisService
 from core.initialization import ensure_initialized
 
 logger = logging.getLogger("graphshift.cli")
@@ -33,6 +30,11 @@ class GraphShiftCommands:
         self.config = config
         self.memory_overrides = memory_overrides or {}
         
+        # Import services on demand so load_configuration() stays lightweight
+        from services.help_service import HelpService
+        from services.health_service import HealthService
+        from services.analysis_service import AnalysisService
+        
         # Initialize services (commands.py delegates to these)
         self.help_service = HelpService()
         self.health_service = HealthService(config)
@@ -1,4 +1,3 @@
-#!/usr/bin/env python3
 """
 GraphShift Main Orchestrator
 Responsibilities:
@@ -8,15 +7,10 @@ Responsibilities:
 
 """
 
-import asyncio
 import argparse
 import sys
 import logging
-from pathlib import Path
-from typing import Optional, Dict, Any
-
-# Add current directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from typing import Optional, Dict, Any, List
 
 
 class MainOrchestrator:
@@ -113,6 +107,26 @@ class MainOrchestrator:
             self._print_failed(f"Health check failed: {str(e)}")
             return False
     
+    async def orchestrate_warmup(self) -> bool:
+        """Orchestrate JVM warmup - generate the analyzer's class data sharing archive"""
+        try:
+            from services.base_analyzer import BaseAnalyzer
+            
+            base_analyzer = BaseAnalyzer(self.config)
+            print(f"Generating class data sharing archive: {base_analyzer.class_archive_path}")
+            
+            success, error = await base_analyzer.create_class_archive()
+            if not success:
+                self._print_failed(f"Could not create class archive: {error}")
+                return False
+            
+            print("Warmup complete: analyzer JVM startup will use the shared archive")
+            return True
+            
+        except Exception as e:
+            self._print_failed(f"Warmup failed: {str(e)}")
+            return False
+    
     def _print_starting_repo(self, repo_path: str):
         """CLI Feedback: Starting repository analysis"""
         print(f"Starting analysis: {repo_path}")
@@ -263,21 +277,32 @@ class MainOrchestrator:
             return False
 
 
-def create_argument_parser() -> argparse.ArgumentParser:
-    """Create clean argument parser - just the essentials"""
+def _help_formatter(prog: str) -> argparse.HelpFormatter:
+    """Shared help formatter for the root parser and every subcommand"""
+    return argparse.HelpFormatter(prog, max_help_position=50)
+
+
+def _build_root_parser() -> argparse.ArgumentParser:
+    """Create the top-level parser with global options only"""
     parser = argparse.ArgumentParser(
         prog="graphshift",
         description="GraphShift - Java Migration Analysis Tool",
-        formatter_class=lambda prog: argparse.HelpFormatter(prog, max_help_position=50)
+        formatter_class=_help_formatter
     )
     
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+    # Global options
+    parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose logging")
+    parser.add_argument("--config", help="Configuration file path")
     
-    # Analyze command
+    return parser
+
+
+def _build_analyze_parser(subparsers) -> None:
+    """Register the analyze command and its arguments"""
     analyze_parser = subparsers.add_parser(
         "analyze", 
         help="Analyze Java repositories",
-        formatter_class=lambda prog: argparse.HelpFormatter(prog, max_help_position=50)
+        formatter_class=_help_formatter
     )
     analyze_group = analyze_parser.add_mutually_exclusive_group(required=True)
     analyze_group.add_argument("--repo", help="Single repository URL")
@@ -290,51 +315,119 @@ def create_argument_parser() -> argparse.ArgumentParser:
     analyze_parser.add_argument("--max-repos", type=int, default=500, help="Maximum repositories to analyze")
     analyze_parser.add_argument("--no-keep-clones", action="store_true", help="Delete clones after analysis")
     analyze_parser.add_argument("--provider", choices=["github", "gitlab", "bitbucket"], default="github", help="SCM provider")
-    
-    # Health command
+
+
+def _build_health_parser(subparsers) -> None:
+    """Register the health command and its arguments"""
     health_parser = subparsers.add_parser(
         "health", 
         help="Check system health",
-        formatter_class=lambda prog: argparse.HelpFormatter(prog, max_help_position=50)
+        formatter_class=_help_formatter
     )
     health_parser.add_argument("--verbose", action="store_true", help="Detailed health information")
-    
-    # Init command
+
+
+def _build_init_parser(subparsers) -> None:
+    """Register the init command and its arguments"""
     init_parser = subparsers.add_parser(
         "init", 
         help="Initialize GraphShift configuration",
-        formatter_class=lambda prog: argparse.HelpFormatter(prog, max_help_position=50)
+        formatter_class=_help_formatter
     )
     init_parser.add_argument("--base-dir", help="Base directory for GraphShift files")
-    
-    # Config command
+
+
+def _build_config_parser(subparsers) -> None:
+    """Register the config command and its actions"""
     config_parser = subparsers.add_parser(
         "config",
         help="Manage GraphShift configuration",
-        formatter_class=lambda prog: argparse.HelpFormatter(prog, max_help_position=50)
+        formatter_class=_help_formatter
     )
     config_subparsers = config_parser.add_subparsers(dest='config_action', help='Configuration actions')
+    config_subparsers.add_parser('edit', help='Open config file for editing')
+    config_subparsers.add_parser('show', help='Show current configuration')
+    config_subparsers.add_parser('path', help='Show config file path')
+
+
+def _build_warmup_parser(subparsers) -> None:
+    """Register the warmup command"""
+    subparsers.add_parser(
+        "warmup",
+        help="Generate JVM class archive for faster analyzer startup",
+        formatter_class=_help_formatter
+    )
+
+
+# Subcommand builders, in the order they are listed in --help
+_SUBCOMMAND_BUILDERS = {
+    "analyze": _build_analyze_parser,
+    "health": _build_health_parser,
+    "init": _build_init_parser,
+    "config": _build_config_parser,
+    "warmup": _build_warmup_parser,
+}
+
+# Global options that consume the following token as their value
+_GLOBAL_OPTIONS_WITH_VALUE = {"--config"}
+
+# Global options that take no value
+_GLOBAL_FLAGS = {"--verbose", "-v"}
+
+
+def _selected_command(argv: List[str]) -> Optional[str]:
+    """
+    Return the subcommand named on the command line, if any.
+    Returns None when top-level help or an unknown global option comes first,
+    so the root parser's help and errors list every subcommand.
+    """
+    skip_next = False
+    for token in argv:
+        if skip_next:
+            skip_next = False
+            continue
+        if token in _GLOBAL_OPTIONS_WITH_VALUE:
+            skip_next = True
+            continue
+        if token in _GLOBAL_FLAGS or token.startswith("--config="):
+            continue
+        if token.startswith("-"):
+            return None
+        return token
+    return None
+
+
+def create_argument_parser(argv: Optional[List[str]] = None) -> argparse.ArgumentParser:
+    """
+    Create clean argument parser - just the essentials.
+    Only the selected subcommand's arguments are built; all subcommands are
+    registered when none is selected (top-level --help), it is unknown, or an
+    unknown global option precedes it.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    parser = _build_root_parser()
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
     
-    # config edit
-    config_edit_parser = config_subparsers.add_parser('edit', help='Open config file for editing')
-    
-    # config show
-    config_show_parser = config_subparsers.add_parser('show', help='Show current configuration')
-    
-    # config path
-    config_path_parser = config_subparsers.add_parser('path', help='Show config file path')
-    
-    # Global options
-    parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose logging")
-    parser.add_argument("--config", help="Configuration file path")
+    command = _selected_command(argv)
+    if command in _SUBCOMMAND_BUILDERS:
+        _SUBCOMMAND_BUILDERS[command](subparsers)
+    else:
+        for build_subparser in _SUBCOMMAND_BUILDERS.values():
+            build_subparser(subparsers)
     
     return parser
 
 
-async def main():
-    """Clean main function - just argument parsing and orchestration routing"""
-    parser = create_argument_parser()
-    args = parser.parse_args()
+# Commands that need the loaded configuration (and therefore the services)
+_CONFIGURED_COMMANDS = {"analyze", "health", "warmup"}
+
+
+async def main(args: Optional[argparse.Namespace] = None) -> bool:
+    """Clean main function - just orchestration routing on parsed arguments"""
+    if args is None:
+        args = create_argument_parser().parse_args()
     
     # Setup logging
     logging.basicConfig(
@@ -344,13 +437,15 @@ async def main():
     
     # Initialization check is now handled in cli_entry_point()
     
-    # Load configuration
-    try:
-        from cli.commands import load_configuration
-        config = load_configuration()
-    except Exception as e:
-        print(f"Configuration error: {e}")
-        return False
+    # Load configuration - only commands that use it pay for it
+    config: Dict[str, Any] = {}
+    if args.command in _CONFIGURED_COMMANDS:
+        try:
+            from cli.commands import load_configuration
+            config = load_configuration()
+        except Exception as e:
+            print(f"Configuration error: {e}")
+            return False
     
     # Initialize orchestrator
     orchestrator = MainOrchestrator(config)
@@ -382,13 +477,32 @@ async def main():
     elif args.command == "config":
         success = await orchestrator.orchestrate_config_command(args.config_action)
         
+    elif args.command == "warmup":
+        success = await orchestrator.orchestrate_warmup()
+        
     else:
-        parser.print_help()
+        create_argument_parser([]).print_help()
         return False
     
     return success
 
 
+def _run(coro) -> bool:
+    """Run a coroutine to completion - asyncio is only imported once a command is dispatched"""
+    import asyncio
+    
+    # Use uvloop's faster event loop when installed (not available on Windows)
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            return uvloop.run(coro)
+    
+    return asyncio.run(coro)
+
+
 def cli_entry_point():
     """Entry point for console scripts"""
     try:
@@ -402,12 +516,20 @@ def cli_entry_point():
             if not ensure_initialized():
                 sys.exit(1)
         
-        success = asyncio.run(main())
+        # Parse before starting the event loop so --help and usage errors exit early
+        parser = create_argument_parser()
+        args = parser.parse_args()
+        if args.command is None:
+            parser.print_help()
+            sys.exit(1)
+        
+        success = _run(main(args))
         sys.exit(0 if success else 1)
     except KeyboardInterrupt:
         print("\nOperation cancelled by user.")
         # Give asyncio time to cleanup
         try:
+            import asyncio
             loop = asyncio.get_event_loop()
             if not loop.is_closed():
                 # Cancel all running tasks
@@ -426,4 +548,4 @@ def cli_entry_point():
 
 
 if __name__ == "__main__":
-    cli_entry_point()
\ No newline at end of file
+    cli_entry_point()
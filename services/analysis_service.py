@@ -6,14 +6,46 @@ Local/remote determination happens at abstract level.
 
 import asyncio
 import logging
+import os
+import shutil
+import tempfile
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, AsyncIterator, Callable, Tuple
 
 from .base_analyzer import BaseAnalyzer
 from .clone_service import CloneService
+from .json_io import dump_json_bytes
+from .result_cache import ResultCache
 
 logger = logging.getLogger(__name__)
 
+# Directories that never hold a repository's own Java sources
+_SKIPPED_DIRS = frozenset({'.git', 'node_modules', 'target', 'build'})
+
+
+def _has_java_files(directory: str) -> bool:
+    """Return True as soon as one .java file is found under directory"""
+    for _, dirs, files in os.walk(directory):
+        dirs[:] = [d for d in dirs if d not in _SKIPPED_DIRS]
+        if any(name.endswith('.java') for name in files):
+            return True
+    return False
+
+
+# Prefixes that mark a repository reference as a remote URL
+_REMOTE_PREFIXES = ("http://", "https://", "git@")
+
+
+@lru_cache(maxsize=1024)
+def _resolve_local(path: str) -> Optional[Path]:
+    """Resolve path if it exists on disk, else None - cached across lookups"""
+    try:
+        resolved = Path(path).resolve()
+        return resolved if resolved.exists() else None
+    except (OSError, ValueError):
+        return None
+
 
 class AnalysisService:
     """
@@ -32,9 +64,12 @@ class AnalysisService:
         self.config = config
         self.base_analyzer = BaseAnalyzer(config)
         self.clone_service = CloneService(config)
+        self.result_cache = ResultCache(config)
         
         analysis_config = config.get("graphshift", {}).get("analysis", {})
         self.max_concurrent_repos = analysis_config.get("max_concurrent_repos", 5)
+        # Spill org findings to disk so only one repo's findings are resident at a time
+        self.lazy_findings = analysis_config.get("lazy_findings", False)
     
     async def run_analysis(
         self,
@@ -67,7 +102,7 @@ class AnalysisService:
                 raise ValueError("Must provide either repo_path or org_name")
                 
         except Exception as e:
-            logger.error(f"Analysis failed: {e}", exc_info=True)
+            logger.error("Analysis failed: %s", e, exc_info=True)
             return None
     
     async def _analyze_single_repo(
@@ -80,13 +115,12 @@ class AnalysisService:
         """
         Single repo analysis - handles both local and remote at abstract level.
         """
-        # Abstract level: local/remote determination
-        is_local = self._is_local_path(repo_path)
+        # Abstract level: local/remote determination (resolves local paths once)
+        is_local, repo_name, resolved_path = self._classify(repo_path)
         
         if is_local:
             # Local repo
-            local_path = Path(repo_path).resolve()
-            repo_name = local_path.name
+            local_path = resolved_path
             cleanup_path = None
             
             if progress_callback:
@@ -101,7 +135,6 @@ class AnalysisService:
                 raise Exception(f"Failed to clone repository: {repo_path}")
             
             local_path = clone_result
-            repo_name = self._extract_repo_name(repo_path)
             cleanup_path = clone_result
             
             if progress_callback:
@@ -137,14 +170,14 @@ class AnalysisService:
         """
         # Phase 1: Discovery - only difference between local/remote
         org_path = Path(org_name)
-        is_local = org_path.exists() and org_path.is_dir()
+        is_local = org_path.is_dir()  # single stat - False when missing
         
         if is_local:
             # Local discovery: scan directories
             if progress_callback:
                 progress_callback(f"Discovering repositories in local directory: {org_name}")
             
-            repo_items = self._discover_local_repos(org_path, max_repos)
+            repo_items = await self._discover_local_repos(org_path, max_repos)
             cleanup_paths = None
             
         else:
@@ -169,17 +202,32 @@ class AnalysisService:
         if progress_callback:
             progress_callback(f"Starting parallel analysis of {len(repo_items)} repositories")
         
-        analysis_results = await self._parallel_repo_analysis(
-            repo_items, to_version, scope, progress_callback
-        )
-        
-        # Phase 3: Cleanup - only for remote repos if not keeping clones
-        remote_repos = [item for item in repo_items if not item.get('is_local', True)]
-        if remote_repos and not keep_clones:
-            await self._cleanup_cloned_repos(remote_repos)
+        # Per-run directory for spilled findings (lazy_findings) - the output
+        # formatter removes it once reports are written
+        spill_dir = None
+        if self.lazy_findings:
+            Path('temp').mkdir(exist_ok=True)
+            spill_dir = Path(tempfile.mkdtemp(prefix="findings_", dir='temp')).resolve()
         
-        # Aggregate results
-        total_issues = sum(len(r.get('findings', [])) for r in analysis_results)
+        try:
+            # Aggregate results as each repository finishes
+            analysis_results = []
+            total_issues = 0
+            async for result in self._parallel_repo_analysis(
+                repo_items, to_version, scope, progress_callback, spill_dir
+            ):
+                analysis_results.append(result)
+                total_issues += result['total_issues']
+            
+            # Phase 3: Cleanup - only for remote repos if not keeping clones
+            remote_repos = [item for item in repo_items if not item.get('is_local', True)]
+            if remote_repos and not keep_clones:
+                await self._cleanup_cloned_repos(remote_repos)
+        except BaseException:
+            # Nothing will format these findings - don't leave them behind
+            if spill_dir:
+                shutil.rmtree(spill_dir, ignore_errors=True)
+            raise
         
         return {
             'type': 'organization',
@@ -187,7 +235,8 @@ class AnalysisService:
             'repositories': analysis_results,
             'total_issues': total_issues,
             'repos_analyzed': len(analysis_results),
-            'cleanup_paths': cleanup_paths
+            'cleanup_paths': cleanup_paths,
+            'findings_dir': str(spill_dir) if spill_dir else None
         }
     
     async def _base_repo_analyzer(
@@ -205,10 +254,22 @@ class AnalysisService:
         if progress_callback:
             progress_callback(f"Running analysis on {repo_name}")
         
-        # Run JAR analysis
-        raw_result = await self.base_analyzer.analyze_directory(
-            local_path, to_version, scope
+        # Reuse a cached result when the repository hasn't changed
+        cache_key = await self.result_cache.compute_key(
+            local_path, to_version, scope, self.base_analyzer.jar_path
         )
+        raw_result = self.result_cache.get(cache_key)
+        
+        if raw_result is not None:
+            if progress_callback:
+                progress_callback(f"Using cached analysis for {repo_name}")
+        else:
+            # Run JAR analysis
+            raw_result = await self.base_analyzer.analyze_directory(
+                local_path, to_version, scope
+            )
+            if raw_result:
+                self.result_cache.put(cache_key, raw_result)
         
         if not raw_result:
             raise Exception(f"JAR analysis failed for {repo_name}")
@@ -228,23 +289,39 @@ class AnalysisService:
             'total_issues': len(findings)
         }
     
-    def _discover_local_repos(self, org_path: Path, max_repos: int) -> List[Dict[str, Any]]:
+    async def _discover_local_repos(self, org_path: Path, max_repos: int) -> List[Dict[str, Any]]:
         """Discover local Java repositories - normalized format"""
+        with os.scandir(org_path) as entries:
+            candidates = [
+                entry for entry in entries
+                if entry.is_dir() and not entry.name.startswith('.')
+            ]
+        
+        # Directory walks are blocking - check candidates off the event loop,
+        # one window of max_concurrent_repos at a time so discovery stops early
+        loop = asyncio.get_running_loop()
+        window_size = max(1, self.max_concurrent_repos)
         repo_items = []
-        for item in org_path.iterdir():
-            if item.is_dir() and not item.name.startswith('.'):
-                # Check if it's a Java repository
-                java_files = list(item.rglob("*.java"))
-                if java_files:
-                    # Normalize to same format as remote repos
-                    repo_items.append({
-                        'local_path': item,
-                        'repo_name': item.name,
-                        'success': True,
-                        'is_local': True
-                    })
-                    if len(repo_items) >= max_repos:
-                        break
+        
+        for start in range(0, len(candidates), window_size):
+            window = candidates[start:start + window_size]
+            is_java_repo = await asyncio.gather(*(
+                loop.run_in_executor(None, _has_java_files, entry.path) for entry in window
+            ))
+            
+            for entry, has_java in zip(window, is_java_repo):
+                if not has_java:
+                    continue
+                # Normalize to same format as remote repos
+                repo_items.append({
+                    'local_path': Path(entry.path),
+                    'repo_name': entry.name,
+                    'success': True,
+                    'is_local': True
+                })
+                if len(repo_items) >= max_repos:
+                    return repo_items
+        
         return repo_items
     
     async def _discover_and_clone_remote_repos(
@@ -290,67 +367,105 @@ class AnalysisService:
         repo_items: List[Dict[str, Any]],
         to_version: str,
         scope: str,
-        progress_callback: Optional[Callable[[str], None]] = None
-    ) -> List[Dict[str, Any]]:
+        progress_callback: Optional[Callable[[str], None]] = None,
+        spill_dir: Optional[Path] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
         """
         Parallel repo analysis - unified logic for both local and remote.
         All repo_items now have the same normalized structure.
+        Yields each successful result as soon as its repository finishes;
+        with spill_dir set, findings are written there instead of kept in memory.
         """
-        semaphore = asyncio.Semaphore(self.max_concurrent_repos)
+        async def analyze_single_item(item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            repo_name = item.get('repo_name', 'unknown')
+            try:
+                # Unified handling - all items have same structure now
+                local_path = str(item['local_path'])
+                
+                # Same base repo analyzer for all cases
+                result = await self._base_repo_analyzer(
+                    local_path, repo_name, to_version, scope, progress_callback
+                )
+                
+                if spill_dir is not None:
+                    result = self._spill_findings(result, spill_dir)
+                
+                return result
+                
+            except Exception as e:
+                logger.error("Analysis failed for %s: %s", repo_name, e)
+                return None
+        
+        # Producer/consumer: a fixed pool of workers drains the work queue,
+        # so only max_concurrent_repos analyses exist at any time
+        work_queue: asyncio.Queue = asyncio.Queue()
+        for item in repo_items:
+            work_queue.put_nowait(item)
+        results_queue: asyncio.Queue = asyncio.Queue()
         
-        async def analyze_single_item(item: Dict[str, Any]):
-            async with semaphore:
+        async def worker():
+            while True:
                 try:
-                    # Unified handling - all items have same structure now
-                    local_path = str(item['local_path'])
-                    repo_name = item['repo_name']
-                    
-        
-                    
-                    # Same base repo analyzer for all cases
-                    result = await self._base_repo_analyzer(
-                        local_path, repo_name, to_version, scope, progress_callback
-                    )
-                    
-        
-                    return result
-                    
-                except Exception as e:
-                    print(f"DEBUG: Analysis failed for {repo_name}: {e}")
-                    logger.error(f"Analysis failed for {repo_name}: {e}")
-                    return None
-        
-        # Execute parallel analysis
-        tasks = [analyze_single_item(item) for item in repo_items]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Filter successful results
-        analysis_results = []
-        for result in results:
-            if isinstance(result, Exception):
-                logger.error(f"Analysis task failed: {result}")
-            elif result:
-                analysis_results.append(result)
+                    item = work_queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                await results_queue.put(await analyze_single_item(item))
         
-        return analysis_results
+        worker_count = max(1, min(self.max_concurrent_repos, len(repo_items)))
+        workers = [asyncio.ensure_future(worker()) for _ in range(worker_count)]
+        
+        try:
+            for completed in range(1, len(repo_items) + 1):
+                result = await results_queue.get()
+                
+                if progress_callback:
+                    progress_callback(f"Completed {completed}/{len(repo_items)} repositories")
+                
+                # Only successful results are streamed to the caller
+                if result:
+                    yield result
+        finally:
+            # Consumer stopped early - don't leave analyses running
+            for task in workers:
+                task.cancel()
+    
+    def _spill_findings(self, result: Dict[str, Any], spill_dir: Path) -> Dict[str, Any]:
+        """
+        Move a repo result's findings to a file in spill_dir.
+        The output formatter loads it when writing that repo's reports.
+        """
+        fd, findings_path = tempfile.mkstemp(
+            prefix=f"{result['repository']}_", suffix=".json", dir=spill_dir
+        )
+        with os.fdopen(fd, 'wb') as f:
+            f.write(dump_json_bytes(result['findings']))
+        
+        return {
+            'repository': result['repository'],
+            'findings_path': findings_path,
+            'total_issues': result['total_issues']
+        }
     
     async def _cleanup_cloned_repos(self, clone_results: List[Dict[str, Any]]):
-        """Cleanup cloned repositories"""
-        await self.clone_service.cleanup_cloned_repositories(clone_results)
+        """Cleanup cloned repositories - per-repo deletes run in parallel"""
+        await self.clone_service.cleanup_cloned_repositories(
+            clone_results, self.max_concurrent_repos
+        )
+    
+    def _classify(self, path_or_url: str) -> Tuple[bool, str, Optional[Path]]:
+        """Classify a repository reference as (is_local, repo_name, resolved_path)"""
+        if path_or_url.startswith(_REMOTE_PREFIXES):
+            return False, path_or_url.split("/")[-1].replace(".git", ""), None
+        
+        resolved = _resolve_local(path_or_url)
+        if resolved is None:
+            return False, Path(path_or_url).name, None
+        return True, resolved.name, resolved
     
     def _is_local_path(self, path_or_url: str) -> bool:
         """Determine if path is local or remote URL"""
-        if path_or_url.startswith(("http://", "https://", "git@")):
-            return False
-        
-        try:
-            return Path(path_or_url).resolve().exists()
-        except (OSError, ValueError):
-            return False
+        return self._classify(path_or_url)[0]
     
     def _extract_repo_name(self, repo_path_or_url: str) -> str:
         """Extract repository name from path or URL"""
-        if repo_path_or_url.startswith(("http://", "https://", "git@")):
-            return repo_path_or_url.split("/")[-1].replace(".git", "")
-        else:
-            return Path(repo_path_or_url).name
\ No newline at end of file
+        return self._classify(repo_path_or_url)[1]
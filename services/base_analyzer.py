@@ -4,11 +4,14 @@ Clean separation following the ideal architecture diagram.
 """
 
 import asyncio
-import json
 import logging
+import os
 import subprocess
+import tempfile
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+
+from .json_io import load_json_file
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +45,12 @@ class BaseAnalyzer:
                 # Fallback to relative path
                 self.jar_path = Path(jar_path_config)
         
+        # Resolve once and fail fast - a missing JAR would otherwise fail every analysis
+        self.jar_path = self.jar_path.resolve()
+        if not self.jar_path.is_file():
+            raise FileNotFoundError(f"Analyzer JAR not found: {self.jar_path}")
+        self._jar_str = str(self.jar_path)
+        
         # Defensive programming - ensure defaults are strings
         default_memory = jar_config.get("memory", "2g")
         default_initial_memory = jar_config.get("initial_memory", "512m")
@@ -50,7 +59,35 @@ class BaseAnalyzer:
         self.default_memory = default_memory if isinstance(default_memory, str) else "2g"
         self.default_initial_memory = default_initial_memory if isinstance(default_initial_memory, str) else "512m"
         
-        logger.debug(f"Initialized with memory: {self.default_memory}, initial: {self.default_initial_memory}")
+        # Resolve memory settings once - handle both parameter name formats
+        self._memory = (self.memory_overrides.get("memory") or 
+                        self.memory_overrides.get("heap_size") or 
+                        self.default_memory)
+        self._initial_memory = (self.memory_overrides.get("initial_memory") or 
+                                self.memory_overrides.get("initial_heap") or 
+                                self.default_initial_memory)
+        
+        # JVM startup tuning - C1-only JIT and class data sharing
+        self.quick_start = jar_config.get("quick_start", True)
+        self.class_archive_path = self.jar_path.with_suffix('.jsa')
+        
+        # JVM launch options shared by analysis runs and class archive creation
+        self._jvm_cmd = [
+            'java',
+            f'-Xmx{self._memory}',
+            f'-Xms{self._initial_memory}',
+            '-Xss4m'
+        ]
+        
+        # Static part of the JAR command, shared by every analysis
+        self._base_cmd = self._jvm_cmd + ['-Xshare:auto']
+        if self.quick_start:
+            self._base_cmd.append('-XX:TieredStopAtLevel=1')
+        if self.class_archive_path.exists():
+            self._base_cmd.append(f'-XX:SharedArchiveFile={self.class_archive_path}')
+        self._base_cmd += ['-jar', self._jar_str]
+        
+        logger.debug("Initialized with memory: %s, initial: %s", self._memory, self._initial_memory)
     
     async def analyze_directory(
         self,
@@ -73,76 +110,125 @@ class BaseAnalyzer:
             # Validate directory exists
             dir_path = Path(directory_path)
             if not dir_path.exists() or not dir_path.is_dir():
-                logger.error(f"Directory does not exist: {directory_path}")
+                logger.error("Directory does not exist: %s", directory_path)
                 return None
             
-            # Get memory settings - handle both parameter name formats
-            memory = (self.memory_overrides.get("memory") or 
-                     self.memory_overrides.get("heap_size") or 
-                     self.default_memory)
-            initial_memory = (self.memory_overrides.get("initial_memory") or 
-                             self.memory_overrides.get("initial_heap") or 
-                             self.default_initial_memory)
-            
-            logger.debug(f"Using memory: {memory}, initial: {initial_memory}")
-            
             # Ensure temp directory exists
             Path('temp').mkdir(exist_ok=True)
             
+            # Unique output file per call so concurrent analyses never collide
+            fd, output_file = tempfile.mkstemp(
+                prefix=f"temp_analysis_{target_jdk}_{scope}_", suffix=".json", dir='temp'
+            )
+            os.close(fd)
+            output_path = Path(output_file)
+            
             # Build JAR command
-            output_file = f"temp_analysis_{target_jdk}_{scope}.json"
-            cmd = [
-                'java',
-                f'-Xmx{memory}',
-                f'-Xms{initial_memory}',
-                '-Xss4m',
-                '-jar', str(self.jar_path),
+            cmd = self._base_cmd + [
                 '-d', str(dir_path),
                 '-t', target_jdk,
                 '--scope', scope,
-                '-o', f"./temp/{output_file}"
+                '-o', str(output_path)
             ]
             
-            logger.debug(f"Running analysis: {' '.join(cmd)}")
-            
-            # Execute JAR
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Running analysis: %s", ' '.join(cmd))
             
-            stdout, stderr = await process.communicate()
-            
-            if process.returncode == 0:
+            try:
+                # Execute JAR
+                process = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
+                )
+                
+                stdout, stderr = await process.communicate()
+                
+                if process.returncode != 0:
+                    logger.error("JAR analysis failed: %s", stderr.decode())
+                    return None
+                
                 # Read the output file
-                output_path = Path('temp') / output_file
-                if output_path.exists():
-                    with open(output_path, 'r', encoding='utf-8') as f:
-                        result = json.load(f)
-                    output_path.unlink()  # Clean up temp file
-                    
-                    logger.debug(f"JAR analysis completed for {directory_path}")
-                    return result
-                else:
-                    logger.error("JAR completed but output file not found")
+                if output_path.stat().st_size == 0:
+                    logger.error("JAR completed but produced no output")
                     return None
-            else:
-                logger.error(f"JAR analysis failed: {stderr.decode()}")
-                return None
+                
+                result = load_json_file(output_path)
+                logger.debug("JAR analysis completed for %s", directory_path)
+                return result
+            finally:
+                output_path.unlink(missing_ok=True)  # Clean up temp file
                 
         except Exception as e:
-            logger.error(f"JAR execution failed: {e}")
+            logger.error("JAR execution failed: %s", e)
             return None
     
+    async def create_class_archive(self) -> Tuple[bool, Optional[str]]:
+        """
+        Generate the class data sharing archive next to the JAR.
+        
+        Runs one analysis of a tiny sample project with
+        -XX:ArchiveClassesAtExit (JDK 13+) so later runs start from the
+        archived analyzer classes.
+        
+        Returns:
+            Tuple of (success, error message)
+        """
+        archive_dir = self.class_archive_path.parent
+        if not os.access(archive_dir, os.W_OK):
+            return False, f"Cannot write class archive: {archive_dir} is not writable"
+        
+        try:
+            with tempfile.TemporaryDirectory() as sample_dir:
+                sample_path = Path(sample_dir)
+                (sample_path / "Sample.java").write_text(
+                    "public class Sample {\n"
+                    "    public static void main(String[] args) {\n"
+                    "        System.out.println(new Integer(1));\n"
+                    "    }\n"
+                    "}\n",
+                    encoding='utf-8'
+                )
+                cmd = self._jvm_cmd + [
+                    f'-XX:ArchiveClassesAtExit={self.class_archive_path}',
+                    '-jar', self._jar_str,
+                    '-d', str(sample_path),
+                    '-o', str(sample_path / "sample_analysis.json")
+                ]
+                
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Creating class archive: %s", ' '.join(cmd))
+                
+                try:
+                    process = await asyncio.create_subprocess_exec(
+                        *cmd,
+                        stdout=asyncio.subprocess.PIPE,
+                        stderr=asyncio.subprocess.PIPE
+                    )
+                except FileNotFoundError:
+                    error = "Java executable not found on PATH"
+                    logger.error("Class archive creation failed: %s", error)
+                    return False, error
+                stdout, stderr = await process.communicate()
+            
+            if process.returncode != 0:
+                error = stderr.decode(errors='replace').strip() or f"java exited with code {process.returncode}"
+                logger.error("Class archive creation failed: %s", error)
+                return False, error
+            
+            if not self.class_archive_path.exists():
+                error = "JVM did not write the class archive (requires JDK 13 or newer)"
+                logger.error("Class archive creation failed: %s", error)
+                return False, error
+            
+            logger.debug("Class archive written to %s", self.class_archive_path)
+            return True, None
+            
+        except Exception as e:
+            logger.error("Class archive creation failed: %s", e)
+            return False, str(e)
+    
     def get_memory_info(self) -> str:
         """Get memory configuration for display"""
-        # Use same logic as JAR execution for consistency
-        memory = (self.memory_overrides.get("memory") or 
-                 self.memory_overrides.get("heap_size") or 
-                 self.default_memory)
-        initial_memory = (self.memory_overrides.get("initial_memory") or 
-                         self.memory_overrides.get("initial_heap") or 
-                         self.default_initial_memory)
-        
-        return f"{memory} memory, {initial_memory} initial"
\ No newline at end of file
+        # Same resolved values as JAR execution for consistency
+        return f"{self._memory} memory, {self._initial_memory} initial"
\ No newline at end of file
@@ -4,6 +4,7 @@ Clean separation of concerns following the ideal architecture diagram.
 """
 
 import asyncio
+import functools
 import logging
 import tempfile
 import shutil
@@ -185,8 +186,31 @@ class CloneService:
                     'org_clone_dir': clone_dir
                 }
     
-    async def cleanup_cloned_repositories(self, clone_results: List[Dict[str, Any]]) -> None:
-        """Clean up cloned repositories after analysis"""
+    async def cleanup_cloned_repositories(
+        self, 
+        clone_results: List[Dict[str, Any]],
+        max_concurrent: int = 5
+    ) -> None:
+        """
+        Clean up cloned repositories after analysis.
+        
+        Args:
+            clone_results: Clone results from clone_organization_repositories
+            max_concurrent: Maximum concurrent repository deletions
+        """
+        # Remove each clone in parallel with semaphore for concurrency control
+        semaphore = asyncio.Semaphore(max_concurrent)
+        
+        async def cleanup_with_semaphore(clone_path: Path) -> None:
+            async with semaphore:
+                await self._cleanup_directory(clone_path)
+        
+        await asyncio.gather(*(
+            cleanup_with_semaphore(clone_info['local_path'])
+            for clone_info in clone_results
+            if clone_info.get('local_path')
+        ))
+        
         # Get unique parent directories to remove
         parent_dirs = set()
         for clone_info in clone_results:
@@ -216,7 +240,11 @@ class CloneService:
                         os.chmod(path, stat.S_IWRITE)
                         func(path)
                 
-                shutil.rmtree(directory, onerror=handle_remove_readonly)
+                # rmtree blocks - run it in the executor so parallel cleanups overlap
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(
+                    None, functools.partial(shutil.rmtree, directory, onerror=handle_remove_readonly)
+                )
                 logger.debug(f"Cleaned up directory: {directory}")
         except Exception as e:
             logger.warning(f"Failed to cleanup {directory}: {e}")
@@ -0,0 +1,28 @@
+"""
+JSON I/O helpers - shared load/dump for analyzer output, cached results
+and spilled findings. Uses orjson when it is installed.
+"""
+
+import json
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def load_json_file(path: Path) -> Any:
+    """Parse a JSON file"""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def dump_json_bytes(data: Any) -> bytes:
+    """Serialize data to UTF-8 encoded JSON"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False).encode('utf-8')
@@ -6,10 +6,13 @@ Uses branching logic: org vs repo detection.
 
 import json
 import logging
+import shutil
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
+from .json_io import load_json_file
+
 logger = logging.getLogger(__name__)
 
 class OutputFormatter:
@@ -62,6 +65,11 @@ class OutputFormatter:
         except Exception as e:
             logger.error(f"Output formatting failed: {e}", exc_info=True)
             raise
+        finally:
+            # Spilled findings (lazy_findings) are only needed while formatting
+            findings_dir = analysis_result.get('findings_dir')
+            if findings_dir:
+                shutil.rmtree(findings_dir, ignore_errors=True)
     
     async def _format_single_repo(
         self, 
@@ -74,7 +82,10 @@ class OutputFormatter:
         Only difference: save folder (parameter)
         """
         repo_name = analysis_result['repository']
-        findings = analysis_result['findings']
+        findings = analysis_result.get('findings')
+        if findings is None:
+            # Findings spilled to disk during org analysis (lazy_findings)
+            findings = self._load_spilled_findings(Path(analysis_result['findings_path']))
         
         # Enrichment step
         enriched_data = self._enrich_findings(findings, repo_name)
@@ -197,6 +208,10 @@ class OutputFormatter:
             'repositories_processed': len(repositories)
         }
 
+    def _load_spilled_findings(self, findings_path: Path) -> List[Dict[str, Any]]:
+        """Load findings spilled by the analysis service"""
+        return load_json_file(findings_path)
+    
     def _enrich_findings(self, findings: List[Dict[str, Any]], repo_name: str) -> Dict[str, Any]:
         """
         Enrich raw findings with metadata and summary.
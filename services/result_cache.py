@@ -0,0 +1,155 @@
+"""
+Result Cache - content-addressed cache of JAR analysis results.
+Skips re-analysis when a repository hasn't changed since its last analysis.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+
+from .json_io import load_json_file, dump_json_bytes
+
+logger = logging.getLogger(__name__)
+
+
+def _source_fingerprint(directory: str) -> str:
+    """Fingerprint a non-git directory from its Java files' paths, sizes and mtimes"""
+    digest = hashlib.sha256()
+    for root, dirs, files in os.walk(directory):
+        dirs[:] = sorted(d for d in dirs if d != '.git')
+        for name in sorted(files):
+            if name.endswith('.java'):
+                file_path = os.path.join(root, name)
+                stat = os.stat(file_path)
+                rel_path = os.path.relpath(file_path, directory)
+                digest.update(f"{rel_path}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    On-disk cache of raw analyzer output.
+    
+    Keys combine the repository content (git HEAD for clean, tracked
+    directories, otherwise a Java file fingerprint) with target JDK, scope and the
+    analyzer JAR, so any of them changing forces a fresh analysis.
+    """
+    
+    def __init__(self, config: Dict[str, Any]):
+        """Initialize result cache with configuration"""
+        cache_config = config.get("graphshift", {}).get("cache", {})
+        self.enabled = cache_config.get("enabled", False)
+        self.cache_dir = Path(cache_config.get("directory", "~/.cache/graphshift")).expanduser()
+    
+    async def compute_key(
+        self,
+        directory: str,
+        target_jdk: str,
+        scope: str,
+        jar_path: Path
+    ) -> Optional[str]:
+        """
+        Compute the cache key for analyzing directory.
+        
+        Returns:
+            Hex digest key, or None if caching is disabled or unavailable
+        """
+        if not self.enabled:
+            return None
+        
+        try:
+            fingerprint = await self._git_fingerprint(directory)
+            if fingerprint is None:
+                loop = asyncio.get_running_loop()
+                fingerprint = await loop.run_in_executor(None, _source_fingerprint, directory)
+            
+            jar_stat = jar_path.stat()
+            raw_key = f"{fingerprint}|{target_jdk}|{scope}|{jar_stat.st_size}|{jar_stat.st_mtime_ns}"
+            return hashlib.sha256(raw_key.encode()).hexdigest()
+        except Exception as e:
+            logger.debug("Result cache key unavailable for %s: %s", directory, e)
+            return None
+    
+    def get(self, key: Optional[str]) -> Optional[Any]:
+        """Return the cached result for key, or None on a miss"""
+        if key is None:
+            return None
+        
+        cache_file = self.cache_dir / f"{key}.json"
+        try:
+            return load_json_file(cache_file)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning("Ignoring unreadable cache entry %s: %s", cache_file, e)
+            return None
+    
+    def put(self, key: Optional[str], result: Any) -> None:
+        """Store result under key - written atomically so readers never see partial files"""
+        if key is None:
+            return
+        
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, temp_file = tempfile.mkstemp(suffix=".tmp", dir=self.cache_dir)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(dump_json_bytes(result))
+            os.replace(temp_file, self.cache_dir / f"{key}.json")
+        except Exception as e:
+            logger.warning("Failed to write cache entry %s: %s", key, e)
+    
+    async def _git_fingerprint(self, directory: str) -> Optional[str]:
+        """
+        HEAD commit and path prefix of a clean, tracked git directory.
+        
+        Returns None - so the caller falls back to a file fingerprint - when
+        directory isn't tracked content of its checkout (not a repo, ignored,
+        or untracked), has local changes, or contains ignored .java files
+        that HEAD doesn't describe.
+        """
+        try:
+            # Ignored directories (e.g. vendor/ inside a parent checkout) report as clean
+            ignored = await self._run_git(directory, 'check-ignore', '-q', '.')
+            if ignored[0] != 1:
+                return None
+            
+            tracked = await self._run_git(directory, 'ls-files', '--', '.')
+            if tracked[0] != 0 or not tracked[1].strip():
+                return None
+            
+            # Force untracked listing regardless of status.showUntrackedFiles
+            status = await self._run_git(
+                directory, 'status', '--porcelain', '--untracked-files=all', '--', '.'
+            )
+            if status[0] != 0 or status[1].strip():
+                return None
+            
+            # Generated or ignored sources are analyzed but invisible to status
+            ignored_sources = await self._run_git(
+                directory, 'ls-files', '--others', '--ignored', '--exclude-standard', '--', '*.java'
+            )
+            if ignored_sources[0] != 0 or ignored_sources[1].strip():
+                return None
+            
+            # Prefix keeps sibling projects within one checkout apart
+            revision = await self._run_git(directory, 'rev-parse', 'HEAD', '--show-prefix')
+            if revision[0] != 0:
+                return None
+            return "git:" + ":".join(revision[1].decode().split())
+        except OSError:
+            # git not installed
+            return None
+    
+    async def _run_git(self, directory: str, *args: str) -> Tuple[int, bytes]:
+        """Run a git command in directory, returning (returncode, stdout)"""
+        process = await asyncio.create_subprocess_exec(
+            'git', '-C', directory, *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+        stdout, _ = await process.communicate()
+        return process.returncode, stdout
@@ -52,6 +52,10 @@ setup(
             "flake8>=4.0.0",
             "mypy>=0.991",
         ],
+        "speedups": [
+            "orjson>=3.6.0",         # Faster parsing of JAR output
+            "uvloop>=0.18.0; sys_platform != 'win32'",  # Faster event loop
+        ],
     },
     entry_points={
         "console_scripts": [